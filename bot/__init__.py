@@ -2,7 +2,17 @@
 
 __all__ = ["APP_NAME", "__version__"]
 
-from importlib.metadata import version
+from typing import TYPE_CHECKING
 
 APP_NAME = "bot"
-__version__ = version("discord-telegram-bot")
+
+if TYPE_CHECKING:  # provided lazily by __getattr__
+    __version__: str
+
+
+def __getattr__(name: str) -> str:
+    if name == "__version__":  # resolved on first use to keep startup fast
+        from importlib.metadata import version
+
+        return version("discord-telegram-bot")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,3 +3,5 @@ from .broker import *
 from .db import *
 from .logging import *
 from .models import *
+from .scheduler import *
+from .traffic import *
@@ -1,23 +1,30 @@
 __all__ = ["ChatBot"]
 
-import asyncio
 import logging
 from abc import abstractmethod
-from typing import Any, Self
+from typing import Any
 
-from . import broker, db, models
+from . import broker, db, models, scheduler, traffic
 
 
 class ChatBot:
     """Chat bot that connects to a chat brokage service."""
 
-    def __init__(self, broker: broker.ChatBroker, db: db.Database) -> None:
+    def __init__(
+        self,
+        broker: broker.ChatBroker,
+        db: db.Database,
+        scheduler: scheduler.Scheduler,
+        settings: models.BotSettings,
+    ) -> None:
         self.logger = logging.getLogger(type(self).__name__)
         self.subscribers: list[ChatBot] = []
 
         self.broker = broker
         self.database = db
-        self.settings = models.BotSettings(name=Self.__name__)
+        self.scheduler = scheduler
+        self.recorder: traffic.TrafficRecorder | None = None
+        self.settings = settings
 
     @abstractmethod
     async def start(self) -> Any:
@@ -40,7 +47,7 @@ class ChatBot:
 
     def _handle_message(self, message: models.Message) -> None:
         """Handle a new message by sending it to all subscribers."""
-        if not self.settings.is_active:
+        if not self.is_active():
             return
 
         async def handler(bot: ChatBot, message: models.Message) -> None:
@@ -52,22 +59,31 @@ class ChatBot:
                 ) from ex
 
         for subscriber in self.subscribers:
-            if not subscriber.settings.is_active:
+            if not subscriber.is_active():
                 continue
-            asyncio.create_task(handler(subscriber, message))
+            self.scheduler.submit(handler(subscriber, message))
+
+    def _record(
+        self, message: models.Message, kind: str = traffic.MESSAGE_EVENT
+    ) -> None:
+        """Record an inbound message if traffic recording is enabled."""
+        if self.recorder is not None:
+            self.recorder.record(type(self).__name__, message, kind)
 
     # MARK: PAUSE/RESUME ======================================================
 
+    def is_active(self) -> bool:
+        """Whether the bot is active, shared by bots with the same settings."""
+        return self.settings.is_active
+
     def pause_bot(self) -> None:
         """Pause the bot."""
         self.logger.debug("Deactivating bot.")
-        settings = self.database.load(self.settings)
-        settings.is_active = False
-        self.database.save(settings)
+        self.settings.is_active = False
+        self.database.save(self.settings)
 
     def resume_bot(self) -> None:
         """Resume the bot."""
         self.logger.debug("Activating bot.")
-        settings = self.database.load(self.settings)
-        settings.is_active = True
-        self.database.save(settings)
+        self.settings.is_active = True
+        self.database.save(self.settings)
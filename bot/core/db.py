@@ -1,9 +1,9 @@
-__all__ = ["Database", "JSONDataBase"]
+__all__ = ["Database", "JSONDataBase", "MemoryDatabase"]
 
 import logging
 from pathlib import Path
 from threading import Lock
-from typing import Protocol
+from typing import Protocol, cast
 
 from pydantic import BaseModel
 
@@ -39,9 +39,24 @@ class JSONDataBase(Database):
     def load[T: BaseModel](self, model: T) -> T:
         with JSONDataBase.lock:
             self._path(model).touch(exist_ok=True)
-            return model.model_validate_json(
-                self._path(model).read_text() or "{}"
+            return model.model_validate_json(  # default to the given model
+                self._path(model).read_text() or model.model_dump_json()
             )
 
     def _path(self, model: BaseModel) -> Path:
         return self.path / f"{type(model).__name__.lower()}.json"
+
+
+class MemoryDatabase(Database):
+    """Database for storing models in memory."""
+
+    def __init__(self) -> None:
+        self.logger = logging.getLogger(type(self).__name__)
+        self.models: dict[type[BaseModel], BaseModel] = {}
+
+    def save(self, model: BaseModel) -> None:
+        self.models[type(model)] = model.model_copy(deep=True)
+
+    def load[T: BaseModel](self, model: T) -> T:
+        stored = self.models.get(type(model), model)
+        return cast(T, stored.model_copy(deep=True))
@@ -5,9 +5,6 @@ from datetime import datetime
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
-from rich.logging import RichHandler
-from rich.text import Text
-
 WARN_MODULES = ["asyncio", "discord", "telegram", "httpcore", "httpx"]
 """Modules for which to log warnings and above."""
 
@@ -26,6 +23,8 @@ def setup_logging(debug: bool, log_file: Path) -> None:
 
 
 def console_handler(debug: bool) -> logging.Handler:
+    from rich.logging import RichHandler
+
     handler = RichHandler(markup=True, show_path=False)
     handler.setFormatter(
         logging.Formatter(r"%(message)s [bright_black]\[%(name)s][/]")
@@ -35,6 +34,8 @@ def console_handler(debug: bool) -> logging.Handler:
 
 
 def file_handler(log_file: Path) -> logging.Handler:
+    from rich.text import Text
+
     class StripMarkupFilter(logging.Filter):
         def filter(self, record: logging.LogRecord) -> bool:
             if hasattr(record, "msg") and isinstance(record.msg, str):
@@ -1,12 +1,15 @@
 __all__ = [
     "Settings",
+    "load_settings",
     "Brokage",
+    "BotSettings",
     "Message",
     "DatabaseException",
     "DiscordException",
     "TelegramException",
 ]
 
+from functools import cache
 from pathlib import Path
 
 import dotenv
@@ -17,9 +20,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     """Application settings."""
 
-    model_config = SettingsConfigDict(
-        env_file=dotenv.find_dotenv(), extra="allow"
-    )
+    model_config = SettingsConfigDict(extra="allow")
 
     discord_bot_token: str = ""
     telegram_bot_token: str = ""
@@ -27,6 +28,17 @@ class Settings(BaseSettings):
     data_path: Path = Path(__file__).parent.parent.parent / "data"
     db_url: str = f"sqlite:///{data_path/'db.sql'}"
 
+    send_capacity: int = 8
+    """Maximum number of concurrent outbound operations."""
+    control_reserved: int = 2
+    """Outbound capacity reserved for command replies and control actions."""
+
+
+@cache
+def load_settings() -> Settings:
+    """Load the application settings once, including the `.env` file."""
+    return Settings(_env_file=dotenv.find_dotenv())  # type: ignore[call-arg]
+
 
 class Brokage(BaseModel):
     """A chat broker for managing subscriptions."""
@@ -0,0 +1,114 @@
+__all__ = ["Priority", "Scheduler"]
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Any, AsyncIterator, Coroutine
+
+
+class Priority(IntEnum):
+    """Priority classes of outbound operations, highest first."""
+
+    CONTROL = 0
+    """Command replies and control operations."""
+    BULK = 1
+    """Forwarded messages."""
+
+
+class Scheduler:
+    """Scheduler sharing an outbound budget between priority classes.
+
+    The budget is a number of concurrent outbound operations. Control
+    operations may use any free slot and are always served before waiting
+    bulk operations. Bulk operations may only use the slots left over after
+    the reserved control capacity.
+    """
+
+    def __init__(self, capacity: int, reserved: int) -> None:
+        if capacity < 1:
+            raise ValueError("Scheduler capacity must be at least 1.")
+        if not 0 <= reserved < capacity:
+            raise ValueError("Reserved capacity must be below the capacity.")
+
+        self.logger = logging.getLogger(type(self).__name__)
+        self.capacity = capacity
+        self.reserved = reserved
+
+        self._active = 0
+        self._waiters: dict[Priority, deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in Priority
+        }
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority) -> AsyncIterator[None]:
+        """Hold a slot of the outbound budget for the given priority."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def submit(
+        self, coro: Coroutine[Any, Any, Any], name: str | None = None
+    ) -> asyncio.Task[Any]:
+        """Run a coroutine in the background, keeping a reference to it."""
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def join(self) -> None:
+        """Wait for all submitted tasks, including ones they submit."""
+        while pending := {task for task in self._tasks if not task.done()}:
+            await asyncio.wait(pending)
+
+    # MARK: Slots =============================================================
+
+    def _limit(self, priority: Priority) -> int:
+        if priority == Priority.CONTROL:
+            return self.capacity
+        return self.capacity - self.reserved
+
+    def _is_queued_before(self, priority: Priority) -> bool:
+        return any(self._waiters[p] for p in Priority if p <= priority)
+
+    async def _acquire(self, priority: Priority) -> None:
+        if self._active < self._limit(priority) and not (
+            self._is_queued_before(priority)
+        ):
+            self._active += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        self.logger.debug(
+            "Queued %s operation (active: %d).", priority.name, self._active
+        )
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()  # slot was granted before cancellation
+            elif waiter in self._waiters[priority]:  # not yet skipped
+                self._waiters[priority].remove(waiter)
+                self._wake()
+            raise
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        for priority in Priority:  # wake waiters, highest priority first
+            waiters = self._waiters[priority]
+            while waiters and self._active < self._limit(priority):
+                waiter = waiters.popleft()
+                if waiter.done():
+                    continue
+                self._active += 1
+                waiter.set_result(None)
+            if waiters:
+                return  # keep lower priorities behind waiting ones
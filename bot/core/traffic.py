@@ -0,0 +1,105 @@
+__all__ = ["TrafficEvent", "TrafficRecorder", "load_traffic"]
+
+import logging
+import os
+import time
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from . import models
+
+MESSAGE_EVENT = "message"
+"""Kind of events forwarded to subscribers, as opposed to commands."""
+TAIL_SIZE = 4096
+"""Bytes read from the end of a recording to resume it."""
+
+
+class TrafficEvent(BaseModel):
+    """An inbound event, recorded without its content."""
+
+    time: float
+    """Seconds since the recording started."""
+    platform: str
+    """Name of the bot that received the event."""
+    kind: str
+    """The command name, or `message` for forwarded messages."""
+    chat_id: int
+    text_size: int = 0
+    attachment_sizes: list[int] = []
+
+    @property
+    def is_message(self) -> bool:
+        """Whether the event is a message forwarded to subscribers."""
+        return self.kind == MESSAGE_EVENT
+
+    def to_message(self) -> models.Message:
+        """Create a stand-in message with the recorded shape."""
+        return models.Message(
+            chat_id=self.chat_id,
+            text="x" * self.text_size,
+            attachments=[bytes(size) for size in self.attachment_sizes],
+        )
+
+
+class TrafficRecorder:
+    """Recorder of inbound events as JSON lines."""
+
+    def __init__(self, path: Path) -> None:
+        self.logger = logging.getLogger(type(self).__name__)
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.logger.info("Recording traffic to: %s", self.path)
+        offset = _resume(self.path) if self.path.exists() else 0.0
+        self._start = time.monotonic() - offset  # continue earlier sessions
+        self._file = self.path.open("a", buffering=1)  # flush every event
+
+    def record(
+        self, platform: str, message: models.Message, kind: str
+    ) -> None:
+        """Record the metadata of an inbound message."""
+        event = TrafficEvent(
+            time=round(time.monotonic() - self._start, 6),
+            platform=platform,
+            kind=kind,
+            chat_id=message.chat_id,
+            text_size=len(message.text),
+            attachment_sizes=[len(data) for data in message.attachments],
+        )
+        self._file.write(event.model_dump_json(exclude_defaults=True) + "\n")
+
+    def close(self) -> None:
+        """Close the recording. Must be called before exiting the program."""
+        self._file.close()
+
+
+def load_traffic(path: Path) -> list[TrafficEvent]:
+    """Load recorded events, ordered by time."""
+    events: list[TrafficEvent] = []
+    for number, line in enumerate(path.read_text().splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            events.append(TrafficEvent.model_validate_json(line))
+        except ValueError as ex:
+            raise ValueError(f"Invalid event on line {number}.") from ex
+    return sorted(events, key=lambda event: event.time)
+
+
+def _resume(path: Path) -> float:
+    """Drop a partly written last event and return the last event's time."""
+    with path.open("rb+") as file:
+        start = max(0, file.seek(0, os.SEEK_END) - TAIL_SIZE)
+        file.seek(start)
+        tail = file.read()
+        complete = tail[: tail.rfind(b"\n") + 1]
+        if len(complete) < len(tail) and (complete or start == 0):
+            file.truncate(start + len(complete))  # interrupted mid-event
+
+    for line in reversed(complete.splitlines()):
+        try:
+            return TrafficEvent.model_validate_json(line).time
+        except ValueError:
+            continue  # the tail may start in the middle of an event
+    return 0.0
@@ -10,9 +10,14 @@ class DiscordBot(core.ChatBot, commands.Cog):
     COMMAND_PREFIX = "/"
 
     def __init__(
-        self, token: str, broker: core.ChatBroker, db: core.Database
+        self,
+        token: str,
+        broker: core.ChatBroker,
+        db: core.Database,
+        scheduler: core.Scheduler,
+        settings: core.BotSettings,
     ) -> None:
-        super().__init__(broker, db)
+        super().__init__(broker, db, scheduler, settings)
         self.token = token
 
         intents = discord.Intents.none()
@@ -69,10 +74,20 @@ class DiscordBot(core.ChatBot, commands.Cog):
         if message.author == self.bot.user:
             return
         if message.content.startswith(DiscordBot.COMMAND_PREFIX):
+            name = message.content.removeprefix(DiscordBot.COMMAND_PREFIX)
+            command = self.bot.get_command(next(iter(name.split()), ""))
+            if command is not None:  # record registered names only
+                self._record(
+                    core.Message(
+                        text=message.content, chat_id=message.channel.id
+                    ),
+                    kind=DiscordBot.COMMAND_PREFIX + command.name,
+                )
             return
 
-        msg = self._parse(message)
-        self._handle_message(await msg)
+        msg = await self._parse(message)
+        self._record(msg)
+        self._handle_message(msg)
         await self.bot.process_commands(message)
 
     # MARK: Commands ==========================================================
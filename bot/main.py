@@ -1,23 +1,35 @@
+import time
+
+# Intentionally above the other imports, so their cost is timed.
+STARTED = time.perf_counter()
+"""Time at which the CLI started importing, including typer."""
+
+# isort: split
 import asyncio
 import logging
-from typing import Annotated
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
-from bot import core, discord, telegram
-from bot.core import models
-
 from . import APP_NAME
+from .startup import record, report, timed
+
+if TYPE_CHECKING:  # platform modules are imported only when needed
+    from bot import discord, telegram
+    from bot.core import models
 
 logger = logging.getLogger(__name__)
 app = typer.Typer(
     name=APP_NAME,
     context_settings={"help_option_names": ["-h", "--help"]},
 )
+record("import bot.main", STARTED)
 
 
 @app.callback()
 def main(
+    ctx: typer.Context,
     debug_mode: Annotated[
         bool,
         typer.Option(
@@ -26,30 +38,154 @@ def main(
     ] = False,
 ) -> None:
     """Main entry point for the bot package."""
-    app_settings = models.Settings()
-    core.logging.setup_logging(debug_mode, app_settings.data_path / "bot.log")
+    ctx.obj = debug_mode  # runs before help, so setup is left to commands
+
+
+def setup(ctx: typer.Context) -> "models.Settings":
+    """Load the settings and set up logging for a command."""
+    with timed("import bot.core"):
+        from bot import core
+    with timed("settings"):
+        app_settings = core.load_settings()
+    with timed("logging"):
+        core.logging.setup_logging(
+            bool(ctx.obj), app_settings.data_path / "bot.log"
+        )
+    return app_settings
 
 
 @app.command()
-def start() -> None:
+def start(
+    ctx: typer.Context,
+    traffic: Annotated[
+        Path | None,
+        typer.Option(
+            "--record", "-r", help="Record inbound traffic to a file."
+        ),
+    ] = None,
+) -> None:
     """Start the bots."""
-    asyncio.run(start_bots())
+    asyncio.run(start_bots(setup(ctx), traffic))
 
 
-async def start_bots() -> None:
-    # dependencies
-    app_settings = models.Settings()
-    db = core.JSONDataBase(app_settings.data_path)
-    broker = core.ChatBroker(db)
+@app.command()
+def replay(
+    ctx: typer.Context,
+    traffic: Annotated[
+        Path,
+        typer.Argument(
+            exists=True,
+            dir_okay=False,
+            readable=True,
+            help="Recorded traffic file.",
+        ),
+    ],
+    speed: Annotated[
+        float,
+        typer.Option(
+            "--speed",
+            "-s",
+            min=0,
+            help="Replay speed multiplier, 0 for max speed.",
+        ),
+    ] = 1.0,
+    latency: Annotated[
+        float,
+        typer.Option(
+            "--latency", "-l", min=0, help="Simulated request latency in ms."
+        ),
+    ] = 50.0,
+    fanout: Annotated[
+        int,
+        typer.Option(
+            "--fanout", "-f", min=1, help="Subscribed chats per publisher."
+        ),
+    ] = 1,
+) -> None:
+    """Replay recorded traffic against local stand-in bots."""
+    from bot import core
+    from bot import replay as traffic_replay
 
-    # bots setup
-    discord_bot = discord.DiscordBot(
-        app_settings.discord_bot_token, broker, db
+    app_settings = setup(ctx)
+    try:
+        events = core.load_traffic(traffic)
+    except ValueError as ex:
+        raise typer.BadParameter(str(ex), param_hint="'traffic'") from ex
+
+    scheduler = core.Scheduler(
+        app_settings.send_capacity, app_settings.control_reserved
     )
-    telegram_bot = telegram.TelegramBot(
-        app_settings.telegram_bot_token, broker, db
+    replay_report = asyncio.run(
+        traffic_replay.replay(
+            events,
+            speed,
+            latency / 1000,
+            fanout,
+            scheduler,
+        )
     )
+    typer.echo(replay_report.format())
+
+
+@app.command("startup-profile")
+def startup_profile(ctx: typer.Context) -> None:
+    """Report the time spent importing and initializing each component."""
+    app_settings = setup(ctx)
+    try:
+        create_bots(app_settings)
+    except Exception as ex:
+        logger.error("Failed to initialize bots: %s", ex)
+    typer.echo(report())
+
+
+def create_bots(
+    app_settings: "models.Settings",
+) -> tuple["discord.DiscordBot", "telegram.TelegramBot"]:
+    from bot import core
+
+    with timed("import bot.discord"):
+        from bot import discord
+    with timed("import bot.telegram"):
+        from bot import telegram
+
+    # dependencies
+    with timed("database"):
+        db = core.JSONDataBase(app_settings.data_path)
+        broker = core.ChatBroker(db)
+        scheduler = core.Scheduler(
+            app_settings.send_capacity, app_settings.control_reserved
+        )
+        bot_settings = db.load(core.BotSettings(name=APP_NAME))
+
+    # bots setup
+    with timed("discord bot"):
+        discord_bot = discord.DiscordBot(
+            app_settings.discord_bot_token,
+            broker,
+            db,
+            scheduler,
+            bot_settings,
+        )
+    with timed("telegram bot"):
+        telegram_bot = telegram.TelegramBot(
+            app_settings.telegram_bot_token,
+            broker,
+            db,
+            scheduler,
+            bot_settings,
+        )
     discord_bot.subscribe(telegram_bot)
+    return discord_bot, telegram_bot
+
+
+async def start_bots(
+    app_settings: "models.Settings", traffic: Path | None = None
+) -> None:
+    from bot import core
+
+    discord_bot, telegram_bot = create_bots(app_settings)
+    recorder = core.TrafficRecorder(traffic) if traffic else None
+    discord_bot.recorder = telegram_bot.recorder = recorder
 
     try:  # start app
         await telegram_bot.start()
@@ -57,3 +193,5 @@ async def start_bots() -> None:
     finally:  # cleanup
         print()
         await telegram_bot.stop()
+        if recorder:
+            recorder.close()
@@ -0,0 +1,166 @@
+__all__ = ["StandInBot", "ReplayReport", "replay"]
+
+import asyncio
+import logging
+import math
+import time
+from typing import override
+
+from pydantic import BaseModel
+
+from bot import core
+
+SCHEDULED_PLATFORM = "TelegramBot"
+"""Platform whose commands reply through the scheduler."""
+QUANTILES = (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+"""Reported latency percentiles."""
+
+logger = logging.getLogger(__name__)
+
+
+class StandInBot(core.ChatBot):
+    """Local stand-in for a chat platform that simulates request latency."""
+
+    def __init__(
+        self,
+        latency: float,
+        broker: core.ChatBroker,
+        db: core.Database,
+        scheduler: core.Scheduler,
+        settings: core.BotSettings,
+    ) -> None:
+        super().__init__(broker, db, scheduler, settings)
+        self.latency = latency
+        self.requests = 0
+        self.delivered: dict[int, float] = {}
+        """Completion times of sent messages, by message object ID."""
+
+    @override
+    async def start(self) -> None:
+        self.logger.debug("Starting stand-in bot.")
+
+    @override
+    async def send(self, message: core.Message) -> None:
+        for _ in self.broker.get_subscribers(str(message.chat_id)):
+            for _ in message.attachments or [b""]:  # one request per photo
+                async with self.scheduler.slot(core.Priority.BULK):
+                    if not self.is_active():  # as in TelegramBot.send
+                        return
+                    await asyncio.sleep(self.latency)
+                self.requests += 1
+        self.delivered[id(message)] = time.perf_counter()
+
+    async def command(self) -> None:
+        """Simulate replying to a command."""
+        async with self.scheduler.slot(core.Priority.CONTROL):
+            await asyncio.sleep(self.latency)
+        self.requests += 1
+
+
+class ReplayReport(BaseModel):
+    """Throughput and latency of a traffic replay."""
+
+    duration: float
+    """Wall time of the replay, in seconds."""
+    requests: int
+    """Number of simulated outbound requests."""
+    message_latencies: list[float] = []
+    """Seconds from receiving each message to delivering it to all chats."""
+    command_latencies: list[float] = []
+    """Seconds from receiving each Telegram command to replying to it."""
+    unscheduled_commands: int = 0
+    """Commands replied to outside the scheduler, which are not replayed."""
+
+    def format(self) -> str:
+        """Format the report for the console."""
+        lines = [
+            f"duration:    {self.duration:10.3f} s",
+            f"requests:    {self.requests:10d}",
+            f"throughput:  {self.requests / (self.duration or 1):10.1f} /s",
+        ]
+        for name, latencies in (
+            ("messages", self.message_latencies),
+            ("commands", self.command_latencies),
+        ):
+            lines.append(f"{name}:    {len(latencies):10d}")
+            for label, quantile in QUANTILES:
+                value = _percentile(latencies, quantile) * 1000
+                lines.append(f"  {label}:       {value:10.2f} ms")
+            value = max(latencies, default=0) * 1000
+            lines.append(f"  max:       {value:10.2f} ms")
+        lines.append(f"unscheduled: {self.unscheduled_commands:10d}")
+        return "\n".join(lines)
+
+
+async def replay(
+    events: list[core.TrafficEvent],
+    speed: float,
+    latency: float,
+    fanout: int,
+    scheduler: core.Scheduler,
+) -> ReplayReport:
+    """Feed recorded events through the bridge against stand-in bots.
+
+    Events are replayed at `speed` times their recorded pace, or all at once
+    if `speed` is 0. Each publisher is given `fanout` subscribed chats.
+    Only commands of the scheduled platform are replayed, since others reply
+    through their own platform without using the outbound budget.
+    """
+    db = core.MemoryDatabase()
+    broker = core.ChatBroker(db)
+    settings = core.BotSettings(name="replay")
+    publisher = StandInBot(latency, broker, db, scheduler, settings)
+    subscriber = StandInBot(latency, broker, db, scheduler, settings)
+    publisher.subscribe(subscriber)
+
+    for chat_id in {event.chat_id for event in events if event.is_message}:
+        publisher_id = broker.get_publisher_id(str(chat_id))
+        for index in range(fanout):
+            broker.subscribe(f"{chat_id}:{index}", publisher_id)
+
+    received: dict[int, float] = {}
+    messages: list[core.Message] = []  # keep message object IDs unique
+    command_latencies: list[float] = []
+    unscheduled_commands = 0
+
+    async def command(received_at: float) -> None:
+        await subscriber.command()
+        command_latencies.append(time.perf_counter() - received_at)
+
+    logger.info("Replaying %d events.", len(events))
+    start = time.perf_counter()
+    for event in events:
+        if speed:  # wait for the event's time at the replay speed
+            delay = start + event.time / speed - time.perf_counter()
+            await asyncio.sleep(max(delay, 0))
+
+        if not event.is_message:
+            if event.platform == SCHEDULED_PLATFORM:
+                scheduler.submit(command(time.perf_counter()))
+            else:
+                unscheduled_commands += 1
+            continue
+        message = event.to_message()
+        messages.append(message)
+        received[id(message)] = time.perf_counter()
+        publisher._handle_message(message)
+    await scheduler.join()
+
+    return ReplayReport(
+        duration=time.perf_counter() - start,
+        requests=subscriber.requests,
+        message_latencies=[
+            subscriber.delivered[key] - received_at
+            for key, received_at in received.items()
+            if key in subscriber.delivered
+        ],
+        command_latencies=command_latencies,
+        unscheduled_commands=unscheduled_commands,
+    )
+
+
+def _percentile(values: list[float], quantile: float) -> float:
+    if not values:
+        return 0
+    ordered = sorted(values)  # nearest rank
+    return ordered[max(0, math.ceil(quantile * len(ordered)) - 1)]
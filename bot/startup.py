@@ -0,0 +1,38 @@
+"""Timing of the bot's startup, per component."""
+
+__all__ = ["timed", "record", "report"]
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+TIMINGS: dict[str, float] = {}
+"""Seconds spent importing and initializing each component."""
+
+
+@contextmanager
+def timed(component: str) -> Iterator[None]:
+    """Record the time spent in the block under the given component."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(component, start)
+
+
+def record(component: str, start: float) -> None:
+    """Record the time spent since `start`, from `time.perf_counter()`."""
+    elapsed = time.perf_counter() - start
+    TIMINGS[component] = TIMINGS.get(component, 0.0) + elapsed
+
+
+def report() -> str:
+    """Format the recorded timings as a table, in recording order."""
+    width = max((len(component) for component in TIMINGS), default=0)
+    lines = [
+        f"{component:<{width}}  {elapsed * 1000:9.2f} ms"
+        for component, elapsed in TIMINGS.items()
+    ]
+    total = sum(TIMINGS.values()) * 1000
+    lines.append(f"{'total':<{width}}  {total:9.2f} ms")
+    return "\n".join(lines)
@@ -1,6 +1,6 @@
 __all__ = ["TelegramBot"]
 
-from typing import override
+from typing import Any, Callable, Coroutine, override
 
 import telegram
 from telegram.ext import Application, CommandHandler, ContextTypes
@@ -32,9 +32,14 @@ INVALID_MARKDOWN = (
 
 class TelegramBot(core.ChatBot):
     def __init__(
-        self, token: str, broker: core.ChatBroker, db: core.Database
+        self,
+        token: str,
+        broker: core.ChatBroker,
+        db: core.Database,
+        scheduler: core.Scheduler,
+        settings: core.BotSettings,
     ) -> None:
-        super().__init__(broker, db)
+        super().__init__(broker, db, scheduler, settings)
         self.token = token
 
         channel_command_filter = telegram_filters.COMMAND & (
@@ -43,12 +48,23 @@ class TelegramBot(core.ChatBot):
             | telegram_filters.ChatType.CHANNEL
         )
 
-        application = Application.builder().token(self.token).build()
-        application.add_handler(CommandHandler("sub", self.subscribe_command))
-        application.add_handler(CommandHandler("reset", self.reset_command))
+        application = (  # allow control requests alongside bulk sends
+            Application.builder()
+            .token(self.token)
+            .connection_pool_size(self.scheduler.capacity)
+            .build()
+        )
+        application.add_handler(
+            CommandHandler("sub", self._control("sub", self.subscribe_command))
+        )
+        application.add_handler(
+            CommandHandler("reset", self._control("reset", self.reset_command))
+        )
         application.add_handler(
             CommandHandler(
-                "id", self.get_id_command, filters=channel_command_filter
+                "id",
+                self._control("id", self.get_id_command),
+                filters=channel_command_filter,
             )
         )
         self.app = application
@@ -77,15 +93,21 @@ class TelegramBot(core.ChatBot):
         message.text = message.text.replace("@everyone", "").strip()
         for chat_id in self.broker.get_subscribers(str(message.chat_id)):
             if not message.attachments:
-                await self.app.bot.send_message(chat_id, message.text)
+                async with self.scheduler.slot(core.Priority.BULK):
+                    if not self.is_active():  # paused while queued
+                        return
+                    await self.app.bot.send_message(chat_id, message.text)
                 continue
             for attachment in message.attachments:
-                await self.app.bot.send_photo(
-                    chat_id,
-                    attachment,
-                    caption=message.text,
-                    parse_mode=telegram.constants.ParseMode.MARKDOWN_V2,
-                )
+                async with self.scheduler.slot(core.Priority.BULK):
+                    if not self.is_active():
+                        return
+                    await self.app.bot.send_photo(
+                        chat_id,
+                        attachment,
+                        caption=message.text,
+                        parse_mode=telegram.constants.ParseMode.MARKDOWN_V2,
+                    )
 
     # MARK: Commands ==========================================================
 
@@ -186,6 +208,34 @@ class TelegramBot(core.ChatBot):
         if update.message:
             await update.message.delete()
 
+    def _control(
+        self,
+        name: str,
+        command: Callable[
+            [telegram.Update, ContextTypes.DEFAULT_TYPE],
+            Coroutine[Any, Any, None],
+        ],
+    ) -> Callable[
+        [telegram.Update, ContextTypes.DEFAULT_TYPE],
+        Coroutine[Any, Any, None],
+    ]:
+        """Record a command and run it ahead of forwarded messages."""
+
+        async def handler(
+            update: telegram.Update, context: ContextTypes.DEFAULT_TYPE
+        ) -> None:
+            if message := update.effective_message:
+                self._record(
+                    core.Message(
+                        text=message.text or "", chat_id=message.chat_id
+                    ),
+                    kind=f"/{name}",
+                )
+            async with self.scheduler.slot(core.Priority.CONTROL):
+                await command(update, context)
+
+        return handler
+
     @staticmethod
     async def _parse(msg: telegram.Message) -> core.Message:
         """Create a message from a Telegram message."""
@@ -0,0 +1,53 @@
+import asyncio
+from pathlib import Path
+
+from bot import core
+
+
+class GatedBot(core.ChatBot):
+    """Bot whose sends hold a bulk slot until the gate opens."""
+
+    def __init__(
+        self,
+        db: core.Database,
+        scheduler: core.Scheduler,
+        settings: core.BotSettings,
+    ) -> None:
+        super().__init__(core.ChatBroker(db), db, scheduler, settings)
+        self.gate = asyncio.Event()
+        self.sent = 0
+
+    async def start(self) -> None:
+        pass
+
+    async def send(self, message: core.Message) -> None:
+        async with self.scheduler.slot(core.Priority.BULK):
+            if not self.is_active():
+                return
+            await self.gate.wait()
+            self.sent += 1
+
+
+def test_pause_drops_queued_forwards(tmp_path: Path) -> None:
+    async def run() -> int:
+        db = core.JSONDataBase(tmp_path)
+        scheduler = core.Scheduler(capacity=1, reserved=0)
+        settings = db.load(core.BotSettings(name="test"))
+        publisher = GatedBot(db, scheduler, settings)
+        subscriber = GatedBot(db, scheduler, settings)
+        publisher.subscribe(subscriber)
+
+        for _ in range(10):
+            publisher._handle_message(core.Message(chat_id=1, text="hi"))
+        await asyncio.sleep(0)  # first forward holds the only slot
+        publisher.pause_bot()
+        subscriber.gate.set()
+        await scheduler.join()
+        return subscriber.sent
+
+    assert asyncio.run(run()) == 1
+    assert (
+        not core.JSONDataBase(tmp_path)
+        .load(core.BotSettings(name="test"))
+        .is_active
+    )
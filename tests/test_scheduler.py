@@ -0,0 +1,95 @@
+import asyncio
+
+from bot.core import Priority, Scheduler
+
+
+def test_control_runs_before_queued_bulk() -> None:
+    async def run() -> list[str]:
+        scheduler = Scheduler(capacity=2, reserved=0)
+        order: list[str] = []
+
+        async def operation(name: str, priority: Priority) -> None:
+            async with scheduler.slot(priority):
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+        for index in range(4):
+            scheduler.submit(operation(f"bulk-{index}", Priority.BULK))
+        await asyncio.sleep(0)  # fill the budget and queue the rest
+        scheduler.submit(operation("control", Priority.CONTROL))
+        await scheduler.join()
+        return order
+
+    order = asyncio.run(run())
+    assert order.index("control") == 2  # first slot freed after the budget
+
+
+def test_control_uses_reserved_capacity() -> None:
+    async def run() -> bool:
+        scheduler = Scheduler(capacity=2, reserved=1)
+        release = asyncio.Event()
+
+        async def bulk() -> None:
+            async with scheduler.slot(Priority.BULK):
+                await release.wait()
+
+        for _ in range(3):
+            scheduler.submit(bulk())
+        await asyncio.sleep(0)
+
+        control = scheduler.submit(
+            asyncio.wait_for(_acquire(scheduler, Priority.CONTROL), 0.1)
+        )
+        await asyncio.sleep(0.01)
+        done = control.done()
+        release.set()
+        await scheduler.join()
+        return done
+
+    assert asyncio.run(run())
+
+
+def test_cancelled_waiter_skipped_by_release() -> None:
+    async def run() -> None:
+        scheduler = Scheduler(capacity=1, reserved=0)
+        holder_ready = asyncio.Event()
+        waiter: asyncio.Task[None] | None = None
+
+        async def holder() -> None:
+            async with scheduler.slot(Priority.BULK):
+                holder_ready.set()
+                await asyncio.sleep(0.01)
+                assert waiter is not None
+                waiter.cancel()  # release in the same tick as the cancel
+
+        scheduler.submit(holder())
+        await holder_ready.wait()
+        waiter = scheduler.submit(_acquire(scheduler, Priority.BULK))
+        results = await asyncio.gather(
+            *scheduler._tasks, return_exceptions=True
+        )
+
+        assert not any(isinstance(r, ValueError) for r in results)
+        assert waiter.cancelled()
+        await _acquire(scheduler, Priority.BULK)  # budget is intact
+
+    asyncio.run(run())
+
+
+def test_join_returns_when_tasks_finished_in_same_tick() -> None:
+    async def run() -> None:
+        scheduler = Scheduler(capacity=1, reserved=0)
+
+        async def noop() -> None:
+            pass
+
+        scheduler.submit(noop())
+        await asyncio.sleep(0)  # task is done, its discard has not run yet
+        await asyncio.wait_for(scheduler.join(), 1)
+
+    asyncio.run(run())
+
+
+async def _acquire(scheduler: Scheduler, priority: Priority) -> None:
+    async with scheduler.slot(priority):
+        pass
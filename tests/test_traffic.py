@@ -0,0 +1,103 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from bot import core, replay
+
+
+def test_recorder_appends_and_flushes(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.jsonl"
+    message = core.Message(chat_id=1, text="secret", attachments=[b"123"])
+
+    first = core.TrafficRecorder(path)
+    first.record("DiscordBot", message, "message")
+    assert path.read_text()  # written before close
+    first.close()
+
+    second = core.TrafficRecorder(path)
+    second.record("TelegramBot", message, "/sub")
+    second.close()
+
+    events = core.load_traffic(path)
+    assert [event.kind for event in events] == ["message", "/sub"]
+    assert events[1].time >= events[0].time
+    assert events[0].text_size == 6 and events[0].attachment_sizes == [3]
+    assert "secret" not in path.read_text()
+
+
+def test_replay_schedules_only_telegram_commands() -> None:
+    events = [
+        core.TrafficEvent(time=0, platform=platform, kind=kind, chat_id=1)
+        for platform, kind in (
+            ("DiscordBot", "message"),
+            ("DiscordBot", "/pause"),
+            ("TelegramBot", "/sub"),
+        )
+    ]
+    report = asyncio.run(
+        replay.replay(events, 0, 0, 2, core.Scheduler(capacity=2, reserved=1))
+    )
+
+    assert report.requests == 3  # two forwards and one command reply
+    assert len(report.message_latencies) == 1
+    assert len(report.command_latencies) == 1
+    assert report.unscheduled_commands == 1
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 101)]
+    assert replay._percentile(values, 0.99) == 99
+    assert replay._percentile([1.0, 2.0], 0.5) == 1
+    assert replay._percentile([], 0.5) == 0
+
+
+def test_discord_records_registered_command_names_only(
+    tmp_path: Path,
+) -> None:
+    from bot.discord import DiscordBot
+
+    db = core.JSONDataBase(tmp_path)
+    bot = DiscordBot(
+        "",
+        core.ChatBroker(db),
+        db,
+        core.Scheduler(capacity=1, reserved=0),
+        core.BotSettings(name="test"),
+    )
+    bot.recorder = core.TrafficRecorder(tmp_path / "traffic.jsonl")
+    for content in ("/hello\nsecret", "/pause\nsecret"):
+        message = SimpleNamespace(
+            author=object(), content=content, channel=SimpleNamespace(id=1)
+        )
+        asyncio.run(bot.on_message(message))  # type: ignore[arg-type]
+    bot.recorder.close()
+
+    events = core.load_traffic(tmp_path / "traffic.jsonl")
+    assert [event.kind for event in events] == ["/pause"]
+    assert "secret" not in (tmp_path / "traffic.jsonl").read_text()
+
+
+def test_load_traffic_names_invalid_line(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.jsonl"
+    path.write_text(
+        '{"time":0,"platform":"p","kind":"message","chat_id":1}\n{'
+    )
+
+    with pytest.raises(ValueError, match="line 2"):
+        core.load_traffic(path)
+
+
+def test_recorder_resumes_after_interrupted_event(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.jsonl"
+    path.write_text(
+        '{"time":5,"platform":"p","kind":"message","chat_id":1}\n{"time":6,'
+    )
+
+    recorder = core.TrafficRecorder(path)
+    recorder.record("DiscordBot", core.Message(chat_id=1, text=""), "message")
+    recorder.close()
+
+    events = core.load_traffic(path)
+    assert len(events) == 2 and events[1].time >= 5